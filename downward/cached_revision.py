@@ -1,6 +1,8 @@
-import glob
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os.path
 import subprocess
+import tarfile
 
 from lab import tools
 from lab.cached_revision import CachedRevision
@@ -23,24 +25,81 @@ class CachedFastDownwardRevision(CachedRevision):
         )
         self.build_options = build_options
 
-    def _cleanup(self):
+    def _get_build_dirs(self):
+        builds_dir = os.path.join(self.path, "builds")
+        if not os.path.isdir(builds_dir):
+            return []
+        # Use scandir() to get the file types without additional stat calls.
+        with os.scandir(builds_dir) as entries:
+            return [entry.path for entry in entries if entry.is_dir()]
+
+    def _prune_builds(self):
         # Only keep the bin directories in "builds" dir.
-        for path in glob.glob(os.path.join(self.path, "builds", "*", "*")):
-            if os.path.basename(path) != "bin":
-                tools.remove_path(path)
+        for build_dir in self._get_build_dirs():
+            with os.scandir(build_dir) as entries:
+                for entry in entries:
+                    if entry.name != "bin":
+                        tools.remove_path(entry.path)
 
         # Remove unneeded files.
         tools.remove_path(os.path.join(self.path, "build.py"))
 
-        # Strip binaries.
+    def _strip_binaries(self):
         binaries = []
-        for path in glob.glob(os.path.join(self.path, "builds", "*", "bin", "*")):
-            if os.path.basename(path) in ["downward", "preprocess"]:
-                binaries.append(path)
-        subprocess.call(["strip"] + binaries)
-
-        # Compress src directory.
-        subprocess.call(
-            ["tar", "-cf", "src.tar", "--remove-files", "src"], cwd=self.path
-        )
-        subprocess.call(["xz", "src.tar"], cwd=self.path)
+        for build_dir in self._get_build_dirs():
+            for binary in ["downward", "preprocess"]:
+                path = os.path.join(build_dir, "bin", binary)
+                if os.path.exists(path):
+                    binaries.append(path)
+        if binaries:
+            subprocess.run(["strip"] + binaries)
+
+    def _compress_src(self):
+        # Stream the tar archive directly into a multi-threaded xz
+        # process to avoid writing an intermediate tar file.
+        src_dir = os.path.join(self.path, "src")
+        with open(os.path.join(self.path, "src.tar.xz"), "wb") as f:
+            with subprocess.Popen(
+                ["xz", "-T0", "-c"], stdin=subprocess.PIPE, stdout=f
+            ) as xz:
+                try:
+                    with tarfile.open(fileobj=xz.stdin, mode="w|") as tf:
+                        tf.add(src_dir, arcname="src")
+                except (OSError, tarfile.TarError) as err:
+                    logging.error(f"Failed to write archive: {err}")
+                    archived = False
+                else:
+                    archived = True
+        if xz.returncode != 0 or not archived:
+            logging.critical(f"Failed to compress {src_dir}")
+        tools.remove_path(src_dir)
+
+    def extract_src(self, dest):
+        """Extract the compressed ``src`` directory of the cached revision to *dest*.
+
+        The revision must have been cached already.
+        """
+        src_archive = os.path.join(self.path, "src.tar.xz")
+        # Decompress with all cores and extract the files while decompressing.
+        with subprocess.Popen(
+            ["xz", "-d", "-c", "-T0", src_archive], stdout=subprocess.PIPE
+        ) as xz:
+            try:
+                with tarfile.open(fileobj=xz.stdout, mode="r|") as tf:
+                    tf.extractall(dest)
+            except (OSError, tarfile.TarError) as err:
+                logging.error(f"Failed to read archive: {err}")
+                extracted = False
+            else:
+                extracted = True
+        if xz.returncode != 0 or not extracted:
+            logging.critical(f"Failed to extract {src_archive}")
+
+    def _cleanup(self):
+        # The cleanup steps touch disjoint paths, so we can run them in parallel.
+        steps = [self._prune_builds, self._strip_binaries, self._compress_src]
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(step) for step in steps]
+        for future in futures:
+            # Propagate exceptions (including SystemExit) from the steps.
+            future.result()
@@ -4,6 +4,8 @@ import logging
 import math
 import os
 
+import numpy as np
+
 from downward.reports import PlanningReport
 from downward.reports.scatter_matplotlib import ScatterMatplotlib
 from downward.reports.scatter_pgfplots import ScatterPgfplots
@@ -150,7 +152,7 @@ class ScatterPlotReport(PlanningReport):
             logging.critical("ScatterPlotReport needs exactly one attribute")
         self.attribute = self.attributes[0]
         # By default all values are in the same category "None".
-        self.get_category = get_category or (lambda run1, run2: None)
+        self.get_category = get_category
         self.show_missing = show_missing
         if self.output_format == "tex":
             self.writer = ScatterPgfplots
@@ -179,6 +181,10 @@ class ScatterPlotReport(PlanningReport):
     def _fill_categories(self):
         """Map category names to coordinate lists."""
         categories = defaultdict(list)
+        # Bind loop invariants to local names.
+        attribute = self.attribute
+        get_category = self.get_category
+        show_missing = self.show_missing
         for runs in self.problem_runs.values():
             try:
                 run1, run2 = runs
@@ -188,9 +194,9 @@ class ScatterPlotReport(PlanningReport):
                     "Instead of filtering a whole run, try setting only some of its "
                     "attribute values to None in a filter.".format(**runs[0])
                 )
-            category = self.get_category(run1, run2)
-            coord = (run1.get(self.attribute), run2.get(self.attribute))
-            if self.show_missing or None not in coord:
+            coord = (run1.get(attribute), run2.get(attribute))
+            if show_missing or None not in coord:
+                category = get_category(run1, run2) if get_category else None
                 categories[category].append(coord)
         return categories
 
@@ -229,14 +235,21 @@ class ScatterPlotReport(PlanningReport):
     def _compute_missing_value(self, categories, axis, scale):
         if not self.show_missing:
             return None
-        values = [coord[axis] for coords in categories.values() for coord in coords]
-        real_values = [value for value in values if value is not None]
-        if len(real_values) == len(values):
-            # The list doesn't contain None values.
+        # Collect the values of all categories in one array with NaN for None.
+        values = np.concatenate(
+            [np.empty(0)]
+            + [
+                np.asarray(coords, dtype=float).reshape(-1, 2)[:, axis]
+                for coords in categories.values()
+            ]
+        )
+        missing = np.isnan(values)
+        if not missing.any():
+            # The values don't contain None values.
             return None
-        if not real_values:
+        if missing.all():
             return 1
-        max_value = max(real_values)
+        max_value = float(values[~missing].max())
         if scale == "linear":
             return max_value * 1.1
         return int(10 ** math.ceil(math.log10(max_value)))
@@ -266,6 +279,12 @@ class ScatterPlotReport(PlanningReport):
 
     def _handle_missing_values(self, categories):
         assert not self.relative
+        # Convert the coordinates only once. Use NaN for missing values.
+        categories = {
+            category: np.array(coords, dtype=float)
+            for category, coords in categories.items()
+            if coords
+        }
         x_missing = self._compute_missing_value(categories, 0, self.xscale)
         y_missing = self._compute_missing_value(categories, 1, self.yscale)
         if x_missing is None:
@@ -277,42 +296,27 @@ class ScatterPlotReport(PlanningReport):
         self.x_upper = missing_value
         self.y_upper = missing_value
 
-        if not self.show_missing:
-            # Coords with None values have already been filtered.
+        if missing_value is None:
+            # Either coords with None values have already been filtered or
+            # there are no None values.
             return categories
 
-        new_categories = {}
-        for category, coords in categories.items():
-            coords = [
-                (
-                    x if x is not None else missing_value,
-                    y if y is not None else missing_value,
-                )
-                for x, y in coords
-            ]
-            if coords:
-                new_categories[category] = coords
-        return new_categories
+        return {
+            category: np.where(np.isnan(coords), missing_value, coords)
+            for category, coords in categories.items()
+        }
 
     def _compute_num_tasks_on_sides_of_line(self, categories):
-        min_wins = self.attribute.min_wins
-        x_wins = 0
-        y_wins = 0
+        x_greater = 0
+        x_smaller = 0
         for coords in categories.values():
-            for x, y in coords:
-                if x is None or y is None:
-                    continue
-                if x > y:
-                    if min_wins:
-                        y_wins += 1
-                    else:
-                        x_wins += 1
-                elif x < y:
-                    if min_wins:
-                        x_wins += 1
-                    else:
-                        y_wins += 1
-        return x_wins, y_wins
+            # Missing values become NaN and all comparisons with NaN are false.
+            coords = np.array(coords, dtype=float).reshape(-1, 2)
+            x_greater += np.count_nonzero(coords[:, 0] > coords[:, 1])
+            x_smaller += np.count_nonzero(coords[:, 0] < coords[:, 1])
+        if self.attribute.min_wins:
+            return x_smaller, x_greater
+        return x_greater, x_smaller
 
     def _get_category_styles(self, categories):
         """
@@ -333,7 +337,7 @@ class ScatterPlotReport(PlanningReport):
         ), "The number of shapes and the number of colors must be coprime."
 
         category_styles = {}
-        for i, category in enumerate(sorted(categories)):
+        for i, category in enumerate(categories):
             category_styles[category] = styles[i % len(styles)]
         return category_styles
 
@@ -362,6 +366,13 @@ class ScatterPlotReport(PlanningReport):
             self.categories = self._handle_missing_values(self.categories)
         if not self.categories:
             logging.critical("Plot contains no points.")
+        # Sort the categories only once. The default category (None) comes first.
+        self.categories = dict(
+            sorted(
+                self.categories.items(),
+                key=lambda item: (item[0] is not None, item[0]),
+            )
+        )
 
         self.xlabel = self._get_axis_label(self.xlabel, self.algorithms[0], x_wins)
         self.ylabel = self._get_axis_label(self.ylabel, self.algorithms[1], y_wins)
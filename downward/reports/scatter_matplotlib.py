@@ -5,6 +5,7 @@ import matplotlib
 from matplotlib import figure
 from matplotlib import lines as mlines
 from matplotlib.backends import backend_agg
+import numpy as np
 
 
 class MatplotlibPlot:
@@ -72,10 +73,15 @@ class ScatterMatplotlib:
     def _plot(cls, report, axes):
         axes.grid(b=True, linestyle="-", color="0.75")
 
-        for category, coords in sorted(report.categories.items()):
-            x_vals, y_vals = zip(*coords)
+        for category, coords in report.categories.items():
+            # Pass contiguous arrays to matplotlib instead of tuples of Python numbers.
+            coords = np.asarray(coords, dtype=float)
             axes.scatter(
-                x_vals, y_vals, clip_on=False, label=category, **report.styles[category]
+                coords[:, 0],
+                coords[:, 1],
+                clip_on=False,
+                label=category,
+                **report.styles[category],
             )
 
         axes.set_xbound(upper=report.x_upper)
@@ -14,11 +14,11 @@ class ScatterPgfplots:
         if report.y_upper is not None:
             options["ymax"] = report.y_upper
         lines.append(f"\\begin{{axis}}[{cls._format_options(options)}]")
-        for category, coords in sorted(report.categories.items()):
+        for category, coords in report.categories.items():
             lines.append(
                 "\\addplot+[{}] coordinates {{\n{}\n}};".format(
                     cls._format_options({"only marks": True}),
-                    " ".join(str(c) for c in coords),
+                    " ".join(f"({x}, {y})" for x, y in coords),
                 )
             )
             if category:
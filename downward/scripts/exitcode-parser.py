@@ -61,4 +61,5 @@ def main():
     parser.parse()
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -40,4 +40,5 @@ def main():
     parser.parse()
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -175,4 +175,5 @@ def main():
     parser.parse()
 
 
-main()
+if __name__ == "__main__":
+    main()
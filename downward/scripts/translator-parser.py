@@ -74,6 +74,10 @@ class TranslatorParser(Parser):
         self.add_function(parse_statistics)
 
 
-if __name__ == "__main__":
+def main():
     parser = TranslatorParser()
     parser.parse()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import hashlib
 import logging
 import os.path
 import shutil
+import stat
 import subprocess
 import tarfile
 
@@ -50,6 +51,7 @@ def _raise_unknown_vcs_error(vcs):
     raise AssertionError(f'Unknown version control system "{vcs}".')
 
 
+@functools.lru_cache(maxsize=None)
 def get_version_control_system(repo):
     vcs = [
         x
@@ -66,6 +68,7 @@ def get_version_control_system(repo):
         )
 
 
+@functools.lru_cache(maxsize=None)
 def get_global_rev(repo, rev=None):
     vcs = get_version_control_system(repo)
     if vcs == MERCURIAL:
@@ -76,6 +79,27 @@ def get_global_rev(repo, rev=None):
         _raise_unknown_vcs_error(vcs)
 
 
+def _extract_archive(cmd, cwd, dest):
+    """Extract the tar archive that *cmd* writes to stdout into *dest*.
+
+    The archive is extracted while it is written, so it is never stored
+    on disk. Return the exit code of *cmd*.
+    """
+    logging.info(f"Executing {' '.join(cmd)} in {cwd}")
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, cwd=cwd) as proc:
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as tf:
+                tf.extractall(dest)
+        except tarfile.TarError as err:
+            logging.error(f"Failed to extract archive: {err}")
+            extracted = False
+        else:
+            extracted = True
+    if proc.returncode == 0 and not extracted:
+        return 1
+    return proc.returncode
+
+
 def _compute_md5_hash(mylist):
     m = hashlib.md5()
     for s in mylist:
@@ -83,6 +107,37 @@ def _compute_md5_hash(mylist):
     return m.hexdigest()[:8]
 
 
+def _compute_tree_hash(path):
+    """Return a hash of all files, directories and symlinks below *path*.
+
+    The hash covers the names, types, permission bits and contents (or
+    link targets) of all entries.
+    """
+    m = hashlib.md5()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        # os.walk() lists symlinks to directories in "dirs" without following them.
+        for name in sorted(dirs + files):
+            entry = os.path.join(root, name)
+            st = os.lstat(entry)
+            mode = st.st_mode
+            header = [
+                os.path.relpath(entry, path),
+                str(stat.S_IFMT(mode)),
+                str(stat.S_IMODE(mode)),
+            ]
+            if stat.S_ISLNK(mode):
+                header.append(os.readlink(entry))
+            elif stat.S_ISREG(mode):
+                header.append(str(st.st_size))
+            m.update(tools.get_bytes("\0".join(header) + "\0"))
+            if stat.S_ISREG(mode):
+                with open(entry, "rb") as f:
+                    for chunk in iter(lambda: f.read(2 ** 20), b""):
+                        m.update(chunk)
+    return m.hexdigest()
+
+
 class CachedRevision:
     """This class represents checkouts of a solver.
 
@@ -161,23 +216,23 @@ class CachedRevision:
             tools.makedirs(self.path)
             vcs = get_version_control_system(self.repo)
             if vcs == MERCURIAL:
-                retcode = tools.run_command(
-                    ["hg", "archive", "-r", self.global_rev]
+                # Write a tar archive without a top-level directory to stdout.
+                # Omit .hg_archival.txt since it contains the revision id and
+                # would prevent reusing builds for identical code.
+                cmd = (
+                    ["hg", "archive", "-r", self.global_rev, "--type", "tar"]
+                    + ["--prefix", ".", "--config", "ui.archivemeta=False"]
                     + [f"-X{d}" for d in self.exclude]
-                    + [self.path],
-                    cwd=self.repo,
+                    + ["-"]
                 )
+                retcode = _extract_archive(cmd, self.repo, self.path)
             elif vcs == GIT:
-                tar_archive = os.path.join(self.path, "solver.tgz")
-                cmd = ["git", "archive", "--format", "tar", self.global_rev]
-                with open(tar_archive, "w") as f:
-                    retcode = tools.run_command(cmd, stdout=f, cwd=self.repo)
-
+                retcode = _extract_archive(
+                    ["git", "archive", "--format", "tar", self.global_rev],
+                    self.repo,
+                    self.path,
+                )
                 if retcode == 0:
-                    with tarfile.open(tar_archive) as tf:
-                        tf.extractall(self.path)
-                    tools.remove_path(tar_archive)
-
                     for exclude_dir in self.exclude:
                         path = os.path.join(self.path, exclude_dir)
                         if os.path.exists(path):
@@ -188,11 +243,38 @@ class CachedRevision:
             if retcode != 0:
                 shutil.rmtree(self.path)
                 logging.critical("Failed to make checkout.")
-            self._compile()
-            self._cleanup()
 
-    def _get_sentinel_file(self):
-        return os.path.join(self.path, "build_successful")
+            # Different revisions may contain the same code (e.g., if they
+            # only differ in excluded paths). Reuse existing builds for them.
+            source_hash_file = os.path.join(
+                revision_cache,
+                "source-hashes",
+                _compute_tree_hash(self.path)
+                + "_"
+                + _compute_md5_hash(self.build_cmd + self.exclude),
+            )
+            cached_build = self._get_cached_build(revision_cache, source_hash_file)
+            if cached_build:
+                logging.info(f'Reusing build with identical code: "{cached_build}"')
+                shutil.rmtree(self.path)
+                shutil.copytree(cached_build, self.path, symlinks=True)
+            else:
+                self._compile()
+                self._cleanup()
+                tools.makedirs(os.path.dirname(source_hash_file))
+                tools.write_file(source_hash_file, self.name)
+
+    def _get_cached_build(self, revision_cache, source_hash_file):
+        if not os.path.exists(source_hash_file):
+            return None
+        with open(source_hash_file) as f:
+            path = os.path.join(revision_cache, f.read().strip())
+        if os.path.exists(self._get_sentinel_file(path)):
+            return path
+        return None
+
+    def _get_sentinel_file(self, path=None):
+        return os.path.join(path or self.path, "build_successful")
 
     def _compile(self):
         retcode = tools.run_command(self.build_cmd, cwd=self.path)
@@ -1,10 +1,10 @@
 """Main module for creating experiments."""
 
 from collections import OrderedDict
+import contextlib
 from glob import glob
 import logging
 import os
-import subprocess
 import sys
 
 from lab import environments, tools
@@ -76,6 +76,59 @@ def _check_name(name, typ, extra_chars=""):
         )
 
 
+@contextlib.contextmanager
+def _suppress_stdout():
+    """Redirect stdout to /dev/null on the file descriptor level.
+
+    This also silences output that C extensions and child processes write
+    directly to file descriptor 1.
+    """
+    stdout_fd = 1
+    sys.stdout.flush()
+    saved_fd = os.dup(stdout_fd)
+    try:
+        with open(os.devnull, "w") as devnull:
+            os.dup2(devnull.fileno(), stdout_fd)
+            with contextlib.redirect_stdout(devnull):
+                yield
+    finally:
+        os.dup2(saved_fd, stdout_fd)
+        os.close(saved_fd)
+
+
+def _run_parser_in_process(parser, code, run_dir):
+    """Execute the compiled *code* of *parser* like a script in *run_dir*.
+
+    This avoids starting a new Python interpreter for each run.
+    """
+    root_logger = logging.getLogger("")
+    handlers = root_logger.handlers[:]
+    level = root_logger.level
+    argv = sys.argv
+    cwd = os.getcwd()
+    sys.argv = [parser]
+    sys.path.insert(0, os.path.dirname(parser))
+    os.chdir(run_dir)
+    try:
+        # Since parsers often produce output which we would rather not
+        # want to see for each individual run, we suppress it here.
+        with _suppress_stdout():
+            exec(code, {"__name__": "__main__", "__file__": parser})
+    except SystemExit as err:
+        exitcode = err.code
+    else:
+        exitcode = None
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(os.path.dirname(parser))
+        sys.argv = argv
+        # Parsers configure logging themselves, so restore our configuration.
+        root_logger.handlers = handlers
+        root_logger.setLevel(level)
+    if exitcode not in [None, 0]:
+        logging.critical(f"Parser {parser} failed in {run_dir}: {exitcode}")
+
+
 class _Resource:
     def __init__(self, name, source, dest, symlink, is_parser):
         self.name = name
@@ -456,9 +509,24 @@ class Experiment(_Buildable):
             if not os.path.isdir(self.path):
                 logging.critical(f"{self.path} is missing or not a directory")
 
+            if not any(resource.is_parser for resource in self.resources):
+                # Don't delete the existing properties if there is nothing to parse.
+                logging.warning("No parsers have been added. Skipping parsing.")
+                return
+
             # Copy all parsers from their source to their destination again.
             self._build_resources(only_parsers=True)
 
+            # Compile each parser only once.
+            parsers = []
+            for resource in self.resources:
+                if resource.is_parser:
+                    parser = os.path.join(
+                        self.path, self.env_vars_relative[resource.name]
+                    )
+                    with open(parser) as f:
+                        parsers.append((parser, compile(f.read(), parser, "exec")))
+
             run_dirs = sorted(glob(os.path.join(self.path, "runs-*-*", "*")))
 
             total_dirs = len(run_dirs)
@@ -468,18 +536,8 @@ class Experiment(_Buildable):
                     tools.remove_path(os.path.join(run_dir, "properties"))
                 loglevel = logging.INFO if index % 100 == 0 else logging.DEBUG
                 logging.log(loglevel, f"Parsing run: {index:6d}/{total_dirs:d}")
-                for resource in self.resources:
-                    if resource.is_parser:
-                        parser_filename = self.env_vars_relative[resource.name]
-                        rel_parser = os.path.join("../../", parser_filename)
-                        # Since parsers often produce output which we would
-                        # rather not want to see for each individual run, we
-                        # suppress it here.
-                        subprocess.check_call(
-                            [tools.get_python_executable(), rel_parser],
-                            cwd=run_dir,
-                            stdout=subprocess.DEVNULL,
-                        )
+                for parser, code in parsers:
+                    _run_parser_in_process(parser, code, run_dir)
 
         self.add_step("parse-again", run_parsers)
 
@@ -502,7 +560,9 @@ class Experiment(_Buildable):
         whether to override the existing data or to merge the old and
         new data. Setting *merge* to True or to False has the effect
         that the old data is merged or replaced (and the user will not
-        be prompted).
+        be prompted). To replace existing data without prompting in
+        non-interactive environments, you can also set the environment
+        variable ``LAB_FETCHER_OVERWRITE=1``.
 
         If no *name* is given, call this step "fetch-``basename(src)``".
 
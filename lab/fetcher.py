@@ -1,6 +1,10 @@
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
 from glob import glob
 import logging
+import multiprocessing
 import os
+import shutil
 import sys
 
 from lab import tools
@@ -9,6 +13,11 @@ import lab.experiment
 
 def _check_eval_dir(eval_dir):
     if os.path.exists(eval_dir):
+        if os.environ.get("LAB_FETCHER_OVERWRITE") == "1":
+            # Never block scripted or batched pipelines with a prompt.
+            logging.info(f"Overwriting {eval_dir} (LAB_FETCHER_OVERWRITE=1)")
+            tools.remove_path(eval_dir)
+            return
         answer = (
             input(
                 f"{eval_dir} already exists. Do you want to (o)verwrite it, "
@@ -28,6 +37,29 @@ def _check_eval_dir(eval_dir):
             logging.critical(f'Invalid answer: "{answer}"')
 
 
+# Number of run directories that each worker process scans at once.
+_FETCH_CHUNKSIZE = 16
+
+
+def _get_available_cpus():
+    try:
+        # Respect CPU restrictions, e.g., in Slurm steps.
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS.
+        return multiprocessing.cpu_count()
+
+
+def _get_process_pool(max_workers):
+    # Fork the worker processes instead of spawning them, because spawned
+    # processes import the experiment script and would run its steps again.
+    if sys.version_info >= (3, 7):
+        return ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+        )
+    else:
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+
 class Fetcher:
     """
     Collect data from the runs of an experiment and store it in an
@@ -64,13 +96,15 @@ class Fetcher:
         driver_err = os.path.join(run_dir, "driver.err")
         run_err = os.path.join(run_dir, "run.err")
         for logfile in [driver_err, run_err]:
-            if os.path.exists(logfile):
+            # Only read logs that are not empty, which is rare.
+            try:
+                size = os.path.getsize(logfile)
+            except FileNotFoundError:
+                continue
+            if size > 0:
                 with open(logfile) as f:
                     content = f.read()
-                if content:
-                    props.add_unexplained_error(
-                        f"{os.path.basename(logfile)}: {content}"
-                    )
+                props.add_unexplained_error(f"{os.path.basename(logfile)}: {content}")
         return props
 
     def __call__(self, src_dir, eval_dir=None, merge=None, filter=None, **kwargs):
@@ -106,8 +140,14 @@ class Fetcher:
         fetch_from_eval_dir = not os.path.exists(
             os.path.join(src_dir, "runs-00001-00100")
         )
+        # Whether we can copy the properties file instead of writing it again.
+        copy_src_props = False
         if fetch_from_eval_dir:
-            src_props = tools.Properties(filename=os.path.join(src_dir, "properties"))
+            src_props_file = os.path.join(src_dir, "properties")
+            src_props = tools.Properties(filename=src_props_file)
+            copy_src_props = bool(
+                src_props and not combined_props and not run_filter.filters
+            )
             run_filter.apply(src_props)
             combined_props.update(src_props)
             logging.info(f"Fetched properties of {len(src_props)} runs.")
@@ -120,14 +160,24 @@ class Fetcher:
             run_dirs = sorted(glob(os.path.join(src_dir, "runs-*-*", "*")))
             total_dirs = len(run_dirs)
             logging.info(f"Scanning properties from {total_dirs:d} run directories")
-            for index, run_dir in enumerate(run_dirs, start=1):
-                loglevel = logging.INFO if index % 100 == 0 else logging.DEBUG
-                logging.log(loglevel, f"Scanning: {index:6d}/{total_dirs:d}")
-                props = self.fetch_dir(run_dir)
-                if slurm_err_content:
-                    props.add_unexplained_error("output-to-slurm.err")
-                id_string = "-".join(props["id"])
-                new_props[id_string] = props
+            # Scan the run directories in parallel, but only start as many
+            # worker processes as there are chunks of run directories.
+            workers = min(_get_available_cpus(), max(1, total_dirs // _FETCH_CHUNKSIZE))
+            with contextlib.ExitStack() as stack:
+                if workers == 1:
+                    all_props = map(self.fetch_dir, run_dirs)
+                else:
+                    executor = stack.enter_context(_get_process_pool(workers))
+                    all_props = executor.map(
+                        self.fetch_dir, run_dirs, chunksize=_FETCH_CHUNKSIZE
+                    )
+                for index, props in enumerate(all_props, start=1):
+                    loglevel = logging.INFO if index % 100 == 0 else logging.DEBUG
+                    logging.log(loglevel, f"Scanning: {index:6d}/{total_dirs:d}")
+                    if slurm_err_content:
+                        props.add_unexplained_error("output-to-slurm.err")
+                    id_string = "-".join(props["id"])
+                    new_props[id_string] = props
             run_filter.apply(new_props)
             combined_props.update(new_props)
 
@@ -139,7 +189,11 @@ class Fetcher:
                 unexplained_errors += 1
 
         tools.makedirs(eval_dir)
-        combined_props.write()
+        if copy_src_props:
+            # Let shutil copy the data in the kernel instead of serializing it.
+            shutil.copyfile(src_props_file, combined_props.filename)
+        else:
+            combined_props.write()
         logging.info(
             f"Wrote properties file (contains {unexplained_errors} "
             f"runs with unexplained errors)."
@@ -218,6 +218,10 @@ def find_file(filenames, dir="."):
 def run_command(cmd, **kwargs):
     """Run command cmd and return the output."""
     logging.info(f"Executing {' '.join(cmd)} {kwargs}")
+    # Avoid passing "preexec_fn": without it (and without "start_new_session"
+    # or changing the uid/gid), CPython >= 3.10 starts the child process with
+    # vfork() instead of fork(), which avoids copying the page tables of large
+    # parent processes.
     return subprocess.call(cmd, **kwargs)
 
 
@@ -241,19 +245,15 @@ class Properties(dict):
             else:
                 return super().default(o)
 
+    _JSON_ARGS = {"indent": 2, "separators": (",", ": "), "sort_keys": True}
+
     def __init__(self, filename=None):
         self.filename = filename
         self.load(filename)
         dict.__init__(self)
 
     def __str__(self):
-        return json.dumps(
-            self,
-            cls=self._PropertiesEncoder,
-            indent=2,
-            separators=(",", ": "),
-            sort_keys=True,
-        )
+        return json.dumps(self, cls=self._PropertiesEncoder, **self._JSON_ARGS)
 
     def load(self, filename):
         if not filename or not os.path.exists(filename):
@@ -271,7 +271,18 @@ class Properties(dict):
         """Write the properties to disk."""
         assert self.filename
         makedirs(os.path.dirname(self.filename))
-        write_file(self.filename, str(self))
+        # Write the JSON data in chunks instead of building one large string.
+        # Write to a temporary file first to keep the existing file intact if
+        # serialization fails.
+        tmp_filename = self.filename + ".tmp"
+        try:
+            with open(tmp_filename, "w") as f:
+                json.dump(self, f, cls=self._PropertiesEncoder, **self._JSON_ARGS)
+            os.replace(tmp_filename, self.filename)
+        finally:
+            # Only exists if writing was interrupted or failed.
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
 
 
 class RunFilter:
@@ -36,6 +36,7 @@ setup(
     ],
     install_requires=[
         "matplotlib",  # for scatter plots
+        "numpy",  # for scatter plots
         "simplejson",  # optional, speeds up reading properties files
         "txt2tags>=3.6",  # for HTML and Latex reports
     ],
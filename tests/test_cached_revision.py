@@ -0,0 +1,106 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from downward.cached_revision import CachedFastDownwardRevision
+from lab.cached_revision import CachedRevision
+
+
+def hg(repo, *args):
+    subprocess.run(["hg", "--config", "ui.username=test", *args], cwd=repo, check=True)
+
+
+def git(repo, *args):
+    cmd = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    return subprocess.run(
+        cmd + list(args), cwd=repo, check=True, stdout=subprocess.PIPE, text=True
+    ).stdout.strip()
+
+
+def change_symlink_target(repo):
+    (repo / "link").unlink()
+    (repo / "link").symlink_to("b")
+
+
+def change_exec_bit(repo):
+    (repo / "a" / "code.txt").chmod(0o755)
+
+
+@pytest.mark.skipif(shutil.which("hg") is None, reason="Mercurial is missing")
+def test_reuse_build_for_identical_code(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "experiments").mkdir(parents=True)
+    (repo / "code.txt").write_text("code")
+    (repo / "experiments" / "exp.py").write_text("v1")
+    hg(repo, "init")
+    hg(repo, "commit", "--addremove", "-m", "first")
+    (repo / "experiments" / "exp.py").write_text("v2")
+    hg(repo, "commit", "-m", "second")
+
+    build_log = tmp_path / "build.log"
+    build_cmd = ["sh", "-c", f"echo built >> {build_log}"]
+    revision_cache = str(tmp_path / "revision-cache")
+    revisions = [
+        CachedRevision(str(repo), rev, build_cmd, exclude=["experiments"])
+        for rev in ["0", "1"]
+    ]
+    assert revisions[0].name != revisions[1].name
+    for revision in revisions:
+        revision.cache(revision_cache)
+
+    assert build_log.read_text() == "built\n"
+    for revision in revisions:
+        assert os.path.exists(os.path.join(revision.path, "build_successful"))
+        assert not os.path.exists(os.path.join(revision.path, ".hg_archival.txt"))
+
+
+@pytest.mark.parametrize("change", [change_symlink_target, change_exec_bit])
+def test_no_build_reuse_for_different_code(tmp_path, change):
+    repo = tmp_path / "repo"
+    for subdir in ["a", "b"]:
+        (repo / subdir).mkdir(parents=True)
+        (repo / subdir / "code.txt").write_text("code")
+    (repo / "link").symlink_to("a")
+    git(repo, "init", "-q")
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "first")
+    change(repo)
+    git(repo, "commit", "-q", "-a", "-m", "second")
+
+    build_log = tmp_path / "build.log"
+    build_cmd = ["sh", "-c", f"echo built >> {build_log}"]
+    revision_cache = str(tmp_path / "revision-cache")
+    for rev in ["HEAD~1", "HEAD"]:
+        CachedRevision(str(repo), git(repo, "rev-parse", rev), build_cmd).cache(
+            revision_cache
+        )
+
+    assert build_log.read_text() == "built\nbuilt\n"
+
+
+def test_compress_and_extract_src(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        + ["commit", "-q", "--allow-empty", "-m", "empty"],
+        cwd=repo,
+        check=True,
+    )
+    revision = CachedFastDownwardRevision(str(repo), "HEAD", [])
+    revision.path = str(tmp_path / "cached")
+    src = tmp_path / "cached" / "src"
+    (src / "search").mkdir(parents=True)
+    (src / "search" / "main.cc").write_text("int main() {}")
+    (src / "link.cc").symlink_to("search/main.cc")
+
+    revision._compress_src()
+    assert not src.exists()
+    revision.extract_src(str(tmp_path / "dest"))
+
+    dest = tmp_path / "dest" / "src"
+    assert (dest / "search" / "main.cc").read_text() == "int main() {}"
+    assert os.readlink(dest / "link.cc") == "search/main.cc"
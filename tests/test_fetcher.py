@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from lab.experiment import STATIC_RUN_PROPERTIES_FILENAME
+import lab.fetcher
+
+
+NUM_RUNS = 40
+
+
+@pytest.fixture
+def exp_dir(tmp_path):
+    runs_dir = tmp_path / "exp" / "runs-00001-00100"
+    for index in range(1, NUM_RUNS + 1):
+        run_dir = runs_dir / f"{index:05d}"
+        run_dir.mkdir(parents=True)
+        static_props = {
+            "id": ["algo", f"task{index:03d}"],
+            "index": index,
+            "run_dir": f"runs-00001-00100/{index:05d}",
+        }
+        (run_dir / STATIC_RUN_PROPERTIES_FILENAME).write_text(json.dumps(static_props))
+        (run_dir / "properties").write_text(json.dumps({"cost": index * 10}))
+        (run_dir / "driver.log").write_text("")
+        (run_dir / "run.err").write_text("boom" if index == 7 else "")
+    return tmp_path / "exp"
+
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_fetch_from_exp_dir(exp_dir, tmp_path, monkeypatch, cpus):
+    monkeypatch.setattr(lab.fetcher, "_get_available_cpus", lambda: cpus)
+    eval_dir = tmp_path / "eval"
+    lab.fetcher.Fetcher()(str(exp_dir), eval_dir=str(eval_dir))
+
+    with open(eval_dir / "properties") as f:
+        props = json.load(f)
+    ids = [f"algo-task{index:03d}" for index in range(1, NUM_RUNS + 1)]
+    assert list(props) == ids
+    for index, id_string in enumerate(ids, start=1):
+        run = props[id_string]
+        assert run["index"] == index
+        assert run["cost"] == index * 10
+        if index == 7:
+            assert run["unexplained_errors"] == ["run.err: boom"]
+        else:
+            assert "unexplained_errors" not in run
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from downward.reports.scatter import ScatterPlotReport
+
+
+VALUES = [(1, 2), (0, 3), (None, 4), (5, None), (None, None), (10, 10)]
+
+
+@pytest.fixture
+def eval_dir(tmp_path):
+    props = {}
+    for index, values in enumerate(VALUES):
+        for algo, value in zip(["algo1", "algo2"], values):
+            run = {
+                "algorithm": algo,
+                "domain": f"domain{index % 2}",
+                "problem": f"problem{index}",
+                "id": [algo, f"domain{index % 2}", f"problem{index}"],
+            }
+            if value is not None:
+                run["expansions"] = value
+            props["-".join(run["id"])] = run
+    path = tmp_path / "exp-eval"
+    path.mkdir()
+    with open(path / "properties", "w") as f:
+        json.dump(props, f)
+    return str(path)
+
+
+def domain_as_category(run1, run2):
+    return run1["domain"]
+
+
+def make_plot(eval_dir, **kwargs):
+    report = ScatterPlotReport(attributes=["expansions"], format="tex", **kwargs)
+    report(eval_dir, eval_dir + "/plot")
+    return {
+        category: [tuple(coord) for coord in coords]
+        for category, coords in report.categories.items()
+    }, report
+
+
+def test_show_missing(eval_dir):
+    categories, report = make_plot(eval_dir, get_category=domain_as_category)
+    assert categories == {
+        "domain0": [(1, 2), (10, 4), (10, 10)],
+        "domain1": [(0.1, 3), (5, 10), (10, 10)],
+    }
+    assert report.x_upper == report.y_upper == 10
+    with open(eval_dir + "/plot.tex") as f:
+        assert "(0.1, 3.0) (5.0, 10.0) (10.0, 10.0)" in f.read()
+
+
+def test_hide_missing(eval_dir):
+    categories, report = make_plot(eval_dir, show_missing=False)
+    assert categories == {None: [(1, 2), (0.1, 3), (10, 10)]}
+    assert report.x_upper is None and report.y_upper is None
+
+
+def test_linear_scale(eval_dir):
+    categories, report = make_plot(eval_dir, scale="linear")
+    assert report.x_upper == report.y_upper == pytest.approx(11)
+    assert sorted(categories[None]) == sorted(
+        [(1, 2), (0, 3), (11, 4), (5, 11), (11, 11), (10, 10)]
+    )
+
+
+def test_default_category_with_other_categories(eval_dir):
+    def get_category(run1, run2):
+        return None if run1["domain"] == "domain0" else run1["domain"]
+
+    categories, report = make_plot(eval_dir, get_category=get_category)
+    assert list(categories) == [None, "domain1"]
+    assert report.has_multiple_categories()
+    with open(eval_dir + "/plot.tex") as f:
+        assert "\\addlegendentry{default}" in f.read()
@@ -1,6 +1,8 @@
 import datetime
 import os
 
+import pytest
+
 from lab import tools
 
 
@@ -60,3 +62,15 @@ def test_colors():
     assert tools.get_colors(row, True) == expected_min_wins
     assert tools.get_colors(row, False) == expected_max_wins
     assert tools.rgb_fractions_to_html_color(1, 0, 0.5) == "rgb(255,0,127)"
+
+
+def test_failed_properties_write_keeps_file():
+    filename = os.path.join(base, "properties")
+    props = tools.Properties(filename)
+    props["x"] = 1
+    props.write()
+    props["bad"] = {1, 2}
+    with pytest.raises(TypeError):
+        props.write()
+    assert tools.Properties(filename) == {"x": 1}
+    assert not os.path.exists(filename + ".tmp")
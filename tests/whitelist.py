@@ -1,3 +1,4 @@
+from downward.cached_revision import CachedFastDownwardRevision
 import lab
 from lab import reports
 from lab.calls.call import Call
@@ -9,4 +10,5 @@ reports.Table.set_row_order
 lab.tools.deprecated
 lab.tools.get_lab_path
 
+CachedFastDownwardRevision.extract_src
 Call